@@ -20,7 +20,10 @@ def convert_csv_to_nesw(input_csv, output_txt):
         print(f"Header: {header}")
         print(f"Board: {header[0]}×{header[1]}, Patterns: edge={header[2]}, inner={header[3]}")
 
-        pieces = []
+        # Format output lines while reading (single pass, no tuple list);
+        # only the first rows are kept apart for the preview below.
+        lines = []
+        preview = []
         for row in reader:
             if len(row) >= 4:
                 piece_id = row[0]
@@ -30,25 +33,24 @@ def convert_csv_to_nesw(input_csv, output_txt):
                 north = row[4] if len(row) > 4 and row[4] else '0'
 
                 # Convert to our format: N E S W
-                pieces.append((piece_id, north, east, south, west))
+                lines.append(f"{piece_id} {north} {east} {south} {west}\n")
+                if len(preview) < 3:
+                    preview.append((piece_id, north, east, south, west))
 
-    # Write to output file
+    # Write to output file (header needs the total, so body follows in one call)
     with open(output_txt, 'w') as f:
-        f.write(f"# Eternity II - {header[0]}×{header[1]} - Converted from edge_puzzle CSV\n")
-        f.write(f"# Format: pieceId N E S W\n")
-        f.write(f"# Total pieces: {len(pieces)}\n")
-        f.write(f"#\n")
+        f.write(f"# Eternity II - {header[0]}×{header[1]} - Converted from edge_puzzle CSV\n"
+                f"# Format: pieceId N E S W\n"
+                f"# Total pieces: {len(lines)}\n"
+                f"#\n")
+        f.writelines(lines)
 
-        for piece_id, n, e, s, w in pieces:
-            f.write(f"{piece_id} {n} {e} {s} {w}\n")
-
-    print(f"✓ Converted {len(pieces)} pieces")
+    print(f"✓ Converted {len(lines)} pieces")
     print(f"✓ Output: {output_txt}")
 
     # Print first few pieces for verification
     print(f"\nFirst 3 pieces:")
-    for i in range(min(3, len(pieces))):
-        pid, n, e, s, w = pieces[i]
+    for pid, n, e, s, w in preview:
         print(f"  Piece {pid}: N={n} E={e} S={s} W={w}")
 
 if __name__ == '__main__':
@@ -5,15 +5,17 @@ Enhanced script to expand project-specific wildcard imports.
 
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Set, Dict, List
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, Pattern, Set
 
-def get_project_package_classes(package: str, root: Path) -> Set[str]:
-    """Get all classes in a project package by scanning files."""
+@lru_cache(maxsize=None)
+def get_project_package_classes(package: str, root: Path) -> FrozenSet[str]:
+    """Get all classes in a project package by scanning files (cached per package)."""
     package_path = root / 'src/main/java' / package.replace('.', '/')
 
     if not package_path.exists():
-        return set()
+        return frozenset()
 
     classes = set()
     for java_file in package_path.glob('*.java'):
@@ -21,29 +23,39 @@ def get_project_package_classes(package: str, root: Path) -> Set[str]:
         class_name = java_file.stem
         classes.add(class_name)
 
-    return classes
+    return frozenset(classes)
 
-def find_used_classes(content: str, package: str, available_classes: Set[str]) -> Set[str]:
-    """Find which classes from a package are actually used in the file."""
-    # Remove strings, comments, and imports to avoid false positives
+def strip_code(content: str) -> str:
+    """Remove strings, comments, and imports to avoid false positives."""
     code = re.sub(r'"(?:[^"\\]|\\.)*"', '', content)
     code = re.sub(r'//.*?$', '', code, flags=re.MULTILINE)
     code = re.sub(r'/\*.*?\*/', '', code, flags=re.DOTALL)
     code = re.sub(r'^import\s+.*?;', '', code, flags=re.MULTILINE)
+    return code
+
+@lru_cache(maxsize=None)
+def get_class_pattern(classes: FrozenSet[str]) -> Pattern[str]:
+    """Build one alternation regex matching any of the classes (cached per class set)."""
+    return re.compile(r'\b(' + '|'.join(re.escape(c) for c in classes) + r')\b')
 
-    used = set()
-    for class_name in available_classes:
-        # Check if class is used as a word boundary
-        pattern = r'\b' + re.escape(class_name) + r'\b'
-        if re.search(pattern, code):
-            used.add(class_name)
+def find_used_classes(code: str, available_classes: AbstractSet[str]) -> Set[str]:
+    """Find which classes from a package are actually used in stripped code."""
+    if not available_classes:
+        return set()
 
-    return used
+    # One alternation scan instead of one search per class
+    pattern = get_class_pattern(frozenset(available_classes))
+    return set(pattern.findall(code))
 
-def expand_project_wildcards(file_path: Path, root: Path) -> bool:
-    """Expand project wildcard imports. Returns True if modified."""
+def expand_project_wildcards(file_path: Path, root: Path, content: Optional[str] = None) -> bool:
+    """Expand project wildcard imports. Returns True if modified.
+
+    If the caller already read the file, pass its text as ``content`` to avoid
+    reading it a second time.
+    """
     try:
-        content = file_path.read_text(encoding='utf-8')
+        if content is None:
+            content = file_path.read_text(encoding='utf-8')
         original_content = content
 
         # Find all wildcard imports (both static and regular)
@@ -58,6 +70,7 @@ def expand_project_wildcards(file_path: Path, root: Path) -> bool:
         if not wildcards:
             return False
 
+        code = None  # stripped lazily, only if a project package needs it
         modified = False
         for full_import, package, is_static in wildcards:
             # Skip java.* and javax.* packages (already handled)
@@ -75,7 +88,9 @@ def expand_project_wildcards(file_path: Path, root: Path) -> bool:
                 continue
 
             # Find which classes are actually used
-            used_classes = find_used_classes(content, package, available_classes)
+            if code is None:
+                code = strip_code(content)
+            used_classes = find_used_classes(code, available_classes)
 
             if used_classes:
                 # Build replacement imports
@@ -119,7 +134,7 @@ def main():
         # Check if it has any non-java wildcard imports
         if re.search(r'^import\s+[a-z][a-z0-9_.]+ *\.\*;', content, re.MULTILINE):
             checked_count += 1
-            if expand_project_wildcards(file_path, root):
+            if expand_project_wildcards(file_path, root, content):
                 modified_count += 1
 
     print()
@@ -4,9 +4,21 @@ Script to standardize logging by replacing System.out/err with SolverLogger.
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Tuple
 
+# System.out/err print/println forms and their SolverLogger templates; the
+# template substitution runs entirely in the regex engine (no callbacks)
+_SYSTEM_PRINT_REPLACEMENTS = [
+    (re.compile(r'System\.out\.print(?:ln)?\((.*?)\);'), r'SolverLogger.info(\1);'),
+    (re.compile(r'System\.err\.print(?:ln)?\((.*?)\);'), r'SolverLogger.error(\1);'),
+]
+
+# Number of files handed to the thread pool at a time
+_BATCH_SIZE = 256
+
 def should_skip_file(file_path: Path) -> bool:
     """Determine if a file should be skipped."""
     if file_path.name == 'SolverLogger.java':
@@ -40,53 +52,11 @@ def replace_system_out_calls(content: str) -> Tuple[str, int]:
     """Replace System.out/err calls with SolverLogger. Returns (new_content, num_changes)."""
     changes = 0
 
-    # Pattern: System.out.println(...); -> SolverLogger.info(...);
-    def replace_out_println(match):
-        nonlocal changes
-        changes += 1
-        return f"SolverLogger.info({match.group(1)});"
-
-    content = re.sub(
-        r'System\.out\.println\((.*?)\);',
-        replace_out_println,
-        content
-    )
-
-    # Pattern: System.err.println(...); -> SolverLogger.error(...);
-    def replace_err_println(match):
-        nonlocal changes
-        changes += 1
-        return f"SolverLogger.error({match.group(1)});"
-
-    content = re.sub(
-        r'System\.err\.println\((.*?)\);',
-        replace_err_println,
-        content
-    )
-
-    # Pattern: System.out.print(...); (no ln) -> SolverLogger.info(...);
-    def replace_out_print(match):
-        nonlocal changes
-        changes += 1
-        return f"SolverLogger.info({match.group(1)});"
-
-    content = re.sub(
-        r'System\.out\.print\((.*?)\);',
-        replace_out_print,
-        content
-    )
-
-    # Pattern: System.err.print(...); (no ln) -> SolverLogger.error(...);
-    def replace_err_print(match):
-        nonlocal changes
-        changes += 1
-        return f"SolverLogger.error({match.group(1)});"
-
-    content = re.sub(
-        r'System\.err\.print\((.*?)\);',
-        replace_err_print,
-        content
-    )
+    # System.out.print[ln](...); -> SolverLogger.info(...);
+    # System.err.print[ln](...); -> SolverLogger.error(...);
+    for pattern, template in _SYSTEM_PRINT_REPLACEMENTS:
+        content, count = pattern.subn(template, content)
+        changes += count
 
     return content, changes
 
@@ -96,12 +66,16 @@ def standardize_logging(file_path: Path) -> bool:
         return False
 
     try:
-        content = file_path.read_text(encoding='utf-8')
-        original_content = content
-
-        if not re.search(r'System\.(out|err)\.print', content):
+        # Cheap substring check before decoding and running any regex
+        data = file_path.read_bytes()
+        if b'System.out.print' not in data and b'System.err.print' not in data:
             return False
 
+        # Normalize newlines as read_text() does, so the inserted import
+        # line ('\n'-terminated) never mixes line endings
+        content = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        original_content = content
+
         content, changes = replace_system_out_calls(content)
 
         if changes == 0:
@@ -124,12 +98,18 @@ def standardize_logging(file_path: Path) -> bool:
 def main():
     """Main entry point."""
     root = Path('/Users/laurentzamofing/dev/eternity')
-    files = list((root / 'src/main/java').rglob('*.java'))
+    files = (root / 'src/main/java').rglob('*.java')
 
+    # File I/O dominates, so threads overlap reads and writes. Executor.map
+    # would drain the whole walk up front, so paths are fed in bounded batches.
     modified_count = 0
-    for file_path in files:
-        if standardize_logging(file_path):
-            modified_count += 1
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        while True:
+            batch = list(islice(files, _BATCH_SIZE))
+            if not batch:
+                break
+            results = executor.map(standardize_logging, batch)
+            modified_count += sum(1 for modified in results if modified)
 
     print()
     print(f"Modified: {modified_count} files")